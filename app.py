@@ -5,29 +5,54 @@ Serves the frontend and provides API endpoints for:
     - Password strength analysis
     - Breach checking (HIBP k-anonymity)
     - Secure password generation
+    - Combined analysis + breach check in a single request
 
 Security: Passwords are never logged, stored, or persisted.
 """
 
 import os
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from typing import Optional
 
-from utils.entropy import analyze_password
-from utils.hash_utils import check_breach
+from utils.entropy import MAX_PASSWORD_LENGTH, analyze_password
+from utils.hash_utils import check_breach, warm_up
 from utils.generator import generate_password
 
 import uvicorn
 
 # ─── App Setup ────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Share one HTTP client across requests so connections to the
+    HIBP API are kept alive instead of re-handshaking every check,
+    and open that connection before the first request arrives.
+    """
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    await warm_up(app.state.http)
+    yield
+    await app.state.http.aclose()
+
+
 app = FastAPI(
     title="CypherCraft: The Password Guardian",
     description="Privacy-First Password Analyzer & Generator",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS for local development
@@ -54,15 +79,62 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
 
-# ─── Request Models ───────────────────────────────────────────
-class AnalyzeRequest(BaseModel):
-    password: str = Field(..., min_length=1, max_length=256)
-
-
-class BreachCheckRequest(BaseModel):
-    password: str = Field(..., min_length=1, max_length=256)
+# ─── Request Parsing ──────────────────────────────────────────
+# OpenAPI schema for {"password": "..."} bodies parsed by _read_password
+PASSWORD_BODY_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "required": ["password"],
+                    "properties": {
+                        "password": {
+                            "type": "string",
+                            "minLength": 1,
+                            "maxLength": MAX_PASSWORD_LENGTH
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+async def _read_password(request: Request) -> str:
+    """
+    Read the `password` field from a JSON body of the form
+    {"password": "..."}, without building a Pydantic model.
+    Raises 422 if the body is malformed or the password is not
+    a string of 1–256 characters, or if a Content-Type other than
+    application/json (or */*+json) is sent. A missing Content-Type is
+    accepted, as FastAPI does for model bodies; rejecting text/plain
+    keeps these routes out of CORS "simple requests".
+    """
+    content_type = request.headers.get("content-type")
+    if content_type:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        main_type, _, sub_type = media_type.partition("/")
+        if main_type != "application" or not (sub_type == "json" or sub_type.endswith("+json")):
+            raise HTTPException(status_code=422, detail="Request body must be JSON.")
+
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON.")
+
+    password = data.get("password") if isinstance(data, dict) else None
+    if not isinstance(password, str) or not 1 <= len(password) <= MAX_PASSWORD_LENGTH:
+        raise HTTPException(
+            status_code=422,
+            detail=f"password must be a string of 1–{MAX_PASSWORD_LENGTH} characters."
+        )
+    return password
 
 
+# ─── Request Models ───────────────────────────────────────────
 class GenerateRequest(BaseModel):
     type: str = "standard"                      # standard | pin | passphrase
     length: Optional[int] = 16                  # for standard/pin
@@ -81,26 +153,41 @@ async def serve_frontend(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.post("/api/analyze")
-async def api_analyze(req: AnalyzeRequest):
+@app.post("/api/analyze", openapi_extra=PASSWORD_BODY_OPENAPI)
+async def api_analyze(request: Request):
     """
     Analyze password strength.
     Returns entropy, crack time, strength label, and policy checks.
     Password is processed in memory only — never logged or stored.
     """
-    result = analyze_password(req.password)
-    return result
+    password = await _read_password(request)
+    result = analyze_password(password)
+    return ORJSONResponse(result)
 
 
-@app.post("/api/breach-check")
-async def api_breach_check(req: BreachCheckRequest):
+@app.post("/api/breach-check", openapi_extra=PASSWORD_BODY_OPENAPI)
+async def api_breach_check(request: Request):
     """
     Check if password has been found in known data breaches.
     Uses HIBP k-anonymity model — only first 5 chars of SHA-1 hash
     are sent externally.
     """
-    result = await check_breach(req.password)
-    return result
+    password = await _read_password(request)
+    result = await check_breach(password, request.app.state.http)
+    return ORJSONResponse(result)
+
+
+@app.post("/api/check", openapi_extra=PASSWORD_BODY_OPENAPI)
+async def api_check(request: Request):
+    """
+    Analyze strength and check breaches in one round trip.
+    Analysis is a cached, sub-microsecond lookup, so it runs inline
+    before the HIBP request is awaited.
+    """
+    password = await _read_password(request)
+    analysis = analyze_password(password)
+    breach = await check_breach(password, request.app.state.http)
+    return ORJSONResponse({"analysis": analysis, "breach": breach})
 
 
 @app.post("/api/generate")
@@ -111,7 +198,7 @@ async def api_generate(req: GenerateRequest):
     """
     options = req.model_dump()
     result = generate_password(options)
-    return result
+    return ORJSONResponse(result)
 
 
 # ─── Entry Point ──────────────────────────────────────────────
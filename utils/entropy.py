@@ -12,76 +12,171 @@ Crack time: T = 2^E / guesses_per_second
 """
 
 import math
-import re
+from bisect import bisect_right
+from functools import lru_cache
 
 # Assumed brute-force speed: 10 billion guesses per second
 GUESSES_PER_SECOND = 10_000_000_000
 
+# Longest password the API accepts; the stats table below covers 1..this
+MAX_PASSWORD_LENGTH = 256
 
-def _get_charset_size(password: str) -> int:
+# Character class bits
+_LOWER = 1
+_UPPER = 2
+_DIGIT = 4
+_SYMBOL = 8
+
+
+def _ascii_class(code: int) -> int:
+    """Return the character class bit for an ASCII code point."""
+    if 0x61 <= code <= 0x7A:
+        return _LOWER
+    if 0x41 <= code <= 0x5A:
+        return _UPPER
+    if 0x30 <= code <= 0x39:
+        return _DIGIT
+    return _SYMBOL      # punctuation, whitespace and control characters
+
+
+# Class bit -> marker character produced by str.translate
+_MARKERS = {_LOWER: "L", _UPPER: "U", _DIGIT: "D", _SYMBOL: "S"}
+
+# ASCII code point -> class marker, built once at import.
+# Non-ASCII characters are left untranslated and count as symbols.
+_CLASS_TABLE = str.maketrans({chr(c): _MARKERS[_ascii_class(c)] for c in range(128)})
+_ALNUM_MARKERS = frozenset("LUD")
+
+# Class mask -> character set size
+_CHARSET_SIZES = tuple(
+    26 * bool(mask & _LOWER)        # lowercase letters
+    + 26 * bool(mask & _UPPER)      # uppercase letters
+    + 10 * bool(mask & _DIGIT)      # digits
+    + 32 * bool(mask & _SYMBOL)     # symbols / special characters
+    for mask in range(16)
+)
+
+
+def _class_mask(password: str) -> int:
     """
-    Determine the character set size based on what types
-    of characters appear in the password.
+    Classify every character of the password in a single pass.
     
     Returns:
-        Integer representing the total character set size.
+        Mask with one bit set per character class present.
     """
-    charset = 0
-    if re.search(r"[a-z]", password):
-        charset += 26   # lowercase letters
-    if re.search(r"[A-Z]", password):
-        charset += 26   # uppercase letters
-    if re.search(r"[0-9]", password):
-        charset += 10   # digits
-    if re.search(r"[^a-zA-Z0-9]", password):
-        charset += 32   # symbols / special characters
-    return charset
-
-
-def _format_crack_time(seconds: float) -> str:
+    seen = set(password.translate(_CLASS_TABLE))
+    return (
+        _LOWER * ("L" in seen)
+        | _UPPER * ("U" in seen)
+        | _DIGIT * ("D" in seen)
+        | _SYMBOL * (not seen <= _ALNUM_MARKERS)
+    )
+
+
+# Crack time buckets: upper bound in seconds -> formatter
+_SECONDS_PER_YEAR = 31536000.0
+_CRACK_TIME_THRESHOLDS = (
+    0.001, 1.0, 60.0, 3600.0, 86400.0, _SECONDS_PER_YEAR,
+    100 * _SECONDS_PER_YEAR, 10_000 * _SECONDS_PER_YEAR
+)
+_CRACK_TIME_FORMATS = (
+    lambda seconds: "Instantly",
+    lambda seconds: "Less than a second",
+    lambda seconds: f"{seconds:.1f} seconds",
+    lambda seconds: f"{seconds / 60:.1f} minutes",
+    lambda seconds: f"{seconds / 3600:.1f} hours",
+    lambda seconds: f"{seconds / 86400:.1f} days",
+    lambda seconds: f"{seconds / _SECONDS_PER_YEAR:.1f} years",
+    lambda seconds: f"{seconds / _SECONDS_PER_YEAR / 100:.0f} centuries",
+    lambda seconds: "Virtually uncrackable",
+)
+
+# Strength buckets: upper bound in entropy bits -> label
+_STRENGTH_THRESHOLDS = (28.0, 36.0, 60.0, 80.0)
+_STRENGTH_LABELS = (
+    {"label": "Very Weak", "color": "#ef4444"},     # red
+    {"label": "Weak", "color": "#f97316"},          # orange
+    {"label": "Moderate", "color": "#eab308"},      # yellow
+    {"label": "Strong", "color": "#22c55e"},        # green
+    {"label": "Very Strong", "color": "#06b6d4"},   # cyan
+)
+
+_LOG10_2 = math.log10(2)
+_LOG10_GUESSES = math.log10(GUESSES_PER_SECOND)
+
+
+def _crack_stats(length: int, charset_size: int) -> tuple[float, float, str, dict]:
     """
-    Convert raw seconds into a human-readable time string.
+    Compute entropy, crack time and strength for a password shape.
     
     Returns:
-        Human-readable string like "3 hours", "2.5 centuries", etc.
+        Tuple of (entropy, crack_time_seconds, crack_time, strength),
+        where crack_time is the human-readable estimate and strength
+        is a shared { label, color } dict (do not mutate).
     """
-    if seconds < 0.001:
-        return "Instantly"
-    if seconds < 1:
-        return "Less than a second"
-    if seconds < 60:
-        return f"{seconds:.1f} seconds"
-    if seconds < 3600:
-        return f"{seconds / 60:.1f} minutes"
-    if seconds < 86400:
-        return f"{seconds / 3600:.1f} hours"
-    if seconds < 31536000:
-        return f"{seconds / 86400:.1f} days"
-    
-    years = seconds / 31536000
-    if years < 100:
-        return f"{years:.1f} years"
-    if years < 10_000:
-        return f"{years / 100:.0f} centuries"
-    return "Virtually uncrackable"
+    # Entropy = length × log2(charset_size)
+    entropy = length * math.log2(charset_size) if charset_size > 0 else 0.0
+
+    # Crack time = 2^entropy / guesses_per_second
+    if entropy > 0:
+        # Use log to avoid overflow for very high entropy values
+        log_seconds = entropy * _LOG10_2 - _LOG10_GUESSES
+
+        if log_seconds > 30:  # Astronomically large
+            crack_time_seconds = math.inf
+        else:
+            crack_time_seconds = 10.0 ** log_seconds
+    else:
+        crack_time_seconds = 0.0
+
+    bucket = bisect_right(_CRACK_TIME_THRESHOLDS, crack_time_seconds)
+    crack_time = _CRACK_TIME_FORMATS[bucket](crack_time_seconds)
+    strength = _STRENGTH_LABELS[bisect_right(_STRENGTH_THRESHOLDS, entropy)]
+    return entropy, crack_time_seconds, crack_time, strength
+
 
+# Precomputed stats for every length accepted by the API and every
+# charset size a class mask can produce, so typical requests do no FP math
+_CRACK_STATS_TABLE = {
+    (length, charset_size): _crack_stats(length, charset_size)
+    for length in range(1, MAX_PASSWORD_LENGTH + 1)
+    for charset_size in set(_CHARSET_SIZES) - {0}
+}
 
-def _get_strength_label(entropy: float) -> dict:
+
+@lru_cache(maxsize=2048)
+def _analyze_by_shape(length: int, mask: int) -> dict:
     """
-    Map entropy value to a strength label and color.
+    Build the analysis result for a password shape.
+    
+    The result depends only on length and class mask, so it is cached
+    by shape; no plaintext password is ever held in the cache.
     
     Returns:
-        dict with 'label' and 'color' keys.
+        Analysis dict (shared across calls; do not mutate).
     """
-    if entropy < 28:
-        return {"label": "Very Weak", "color": "#ef4444"}     # red
-    if entropy < 36:
-        return {"label": "Weak", "color": "#f97316"}          # orange
-    if entropy < 60:
-        return {"label": "Moderate", "color": "#eab308"}      # yellow
-    if entropy < 80:
-        return {"label": "Strong", "color": "#22c55e"}        # green
-    return {"label": "Very Strong", "color": "#06b6d4"}       # cyan
+    charset_size = _CHARSET_SIZES[mask]
+
+    stats = _CRACK_STATS_TABLE.get((length, charset_size))
+    if stats is None:
+        stats = _crack_stats(length, charset_size)
+    entropy, crack_time_seconds, crack_time, strength = stats
+
+    return {
+        "length": length,
+        "charset_size": charset_size,
+        "entropy": round(entropy, 2),
+        "crack_time": crack_time,
+        "crack_time_seconds": crack_time_seconds if crack_time_seconds != float("inf") else -1,
+        "strength": strength,
+        "policy": {
+            "min_length": length >= 8,
+            "has_uppercase": bool(mask & _UPPER),
+            "has_lowercase": bool(mask & _LOWER),
+            "has_number": bool(mask & _DIGIT),
+            "has_symbol": bool(mask & _SYMBOL)
+        }
+    }
 
 
 def analyze_password(password: str) -> dict:
@@ -100,6 +195,7 @@ def analyze_password(password: str) -> dict:
             - crack_time_seconds: Raw crack time in seconds
             - strength: { label, color }
             - policy: dict of policy check results
+        Non-empty results are cached by shape and shared; do not mutate.
     """
     if not password:
         return {
@@ -118,38 +214,4 @@ def analyze_password(password: str) -> dict:
             }
         }
 
-    length = len(password)
-    charset_size = _get_charset_size(password)
-    
-    # Entropy = length × log2(charset_size)
-    entropy = length * math.log2(charset_size) if charset_size > 0 else 0
-    
-    # Crack time = 2^entropy / guesses_per_second
-    if entropy > 0:
-        # Use log to avoid overflow for very high entropy values
-        log_combinations = entropy * math.log10(2)
-        log_guesses = math.log10(GUESSES_PER_SECOND)
-        log_seconds = log_combinations - log_guesses
-        
-        if log_seconds > 30:  # Astronomically large
-            crack_time_seconds = float("inf")
-        else:
-            crack_time_seconds = 10 ** log_seconds
-    else:
-        crack_time_seconds = 0
-
-    return {
-        "length": length,
-        "charset_size": charset_size,
-        "entropy": round(entropy, 2),
-        "crack_time": _format_crack_time(crack_time_seconds),
-        "crack_time_seconds": crack_time_seconds if crack_time_seconds != float("inf") else -1,
-        "strength": _get_strength_label(entropy),
-        "policy": {
-            "min_length": length >= 8,
-            "has_uppercase": bool(re.search(r"[A-Z]", password)),
-            "has_lowercase": bool(re.search(r"[a-z]", password)),
-            "has_number": bool(re.search(r"[0-9]", password)),
-            "has_symbol": bool(re.search(r"[^a-zA-Z0-9]", password))
-        }
-    }
+    return _analyze_by_shape(len(password), _class_mask(password))
@@ -16,8 +16,19 @@ import string
 # Common ambiguous characters that can be confused visually
 AMBIGUOUS_CHARS = "il1Lo0O"
 
-# Embedded word list for passphrase generation (common, easy-to-type words)
-WORD_LIST = [
+# Character classes, with ambiguous-free variants precomputed at import
+_LOWER = string.ascii_lowercase
+_UPPER = string.ascii_uppercase
+_DIGITS = string.digits
+_SYMBOLS = string.punctuation
+_LOWER_SAFE = "".join(c for c in _LOWER if c not in AMBIGUOUS_CHARS)
+_UPPER_SAFE = "".join(c for c in _UPPER if c not in AMBIGUOUS_CHARS)
+_DIGITS_SAFE = "".join(c for c in _DIGITS if c not in AMBIGUOUS_CHARS)
+
+# Embedded word list for passphrase generation (common, easy-to-type words).
+# Exactly 128 distinct words, so one random byte masked to 7 bits picks a
+# word uniformly with no rejection step.
+WORD_LIST = (
     "apple", "brave", "cloud", "dance", "eagle", "flame", "grace", "heart",
     "ivory", "jewel", "knack", "lunar", "maple", "night", "ocean", "pearl",
     "quest", "river", "stone", "tiger", "umbra", "vivid", "whale", "xenon",
@@ -32,8 +43,66 @@ WORD_LIST = [
     "piano", "reign", "spice", "tulip", "usher", "viper", "widow", "zesty",
     "acorn", "basin", "cliff", "dodge", "epoch", "flint", "grain", "hydra",
     "image", "joint", "kayak", "libra", "marsh", "north", "omega", "plume",
-    "quota", "ridge", "swirl", "torch", "urban", "verge", "whisk", "axiom"
-]
+    "quota", "ridge", "swirl", "torch", "urban", "verge", "whisk", "axiom",
+    "bloom", "crane", "forge", "lotus", "mango", "otter", "sable", "tempo"
+)
+_WORD_MASK = len(WORD_LIST) - 1
+
+# Masking is only uniform for a power-of-two list length; keep it at 128
+if len(WORD_LIST) & _WORD_MASK or len(WORD_LIST) > 256:
+    raise ValueError("WORD_LIST length must be a power of two (at most 256).")
+
+
+def _randbelow_many(bound: int, count: int) -> list[int]:
+    """
+    Draw uniformly random integers from a single batched CSPRNG read.
+    
+    Each random byte is reduced modulo `bound`; bytes at or above the
+    largest multiple of `bound` are rejected to keep the result unbiased.
+    
+    Args:
+        bound: Exclusive upper bound (1–256).
+        count: Number of integers to draw.
+    
+    Returns:
+        List of `count` integers in [0, bound).
+    """
+    cutoff = 256 - (256 % bound)
+    values = []
+    while len(values) < count:
+        # Over-draw so a top-up read is rarely needed
+        raw = secrets.token_bytes((count - len(values)) * 2)
+        values.extend(b % bound for b in raw if b < cutoff)
+    del values[count:]
+    return values
+
+
+def _shuffle(items: list) -> None:
+    """
+    Shuffle a list in place (Fisher-Yates) using swap indices taken
+    from a single batched CSPRNG read, with rejection against bias.
+    
+    Args:
+        items: List to shuffle; at most 256 items (one byte per swap).
+    """
+    if len(items) > 256:
+        raise ValueError("Cannot shuffle more than 256 items.")
+
+    buf = secrets.token_bytes(2 * len(items))
+    pos = 0
+    for i in range(len(items) - 1, 0, -1):
+        bound = i + 1
+        cutoff = 256 - (256 % bound)
+        while True:
+            if pos == len(buf):
+                # Rare: too many rejections, top up the buffer
+                buf, pos = secrets.token_bytes(len(items)), 0
+            b = buf[pos]
+            pos += 1
+            if b < cutoff:
+                break
+        j = b % bound
+        items[i], items[j] = items[j], items[i]
 
 
 def generate_standard(
@@ -65,47 +134,39 @@ def generate_standard(
     length = max(8, min(128, length))
 
     # Build character pool
-    pool = ""
+    classes = []
     required = []  # Ensure at least one char from each selected class
 
     if lowercase:
-        chars = string.ascii_lowercase
-        if exclude_ambiguous:
-            chars = "".join(c for c in chars if c not in AMBIGUOUS_CHARS)
-        pool += chars
+        chars = _LOWER_SAFE if exclude_ambiguous else _LOWER
+        classes.append(chars)
         required.append(secrets.choice(chars))
 
     if uppercase:
-        chars = string.ascii_uppercase
-        if exclude_ambiguous:
-            chars = "".join(c for c in chars if c not in AMBIGUOUS_CHARS)
-        pool += chars
+        chars = _UPPER_SAFE if exclude_ambiguous else _UPPER
+        classes.append(chars)
         required.append(secrets.choice(chars))
 
     if numbers:
-        chars = string.digits
-        if exclude_ambiguous:
-            chars = "".join(c for c in chars if c not in AMBIGUOUS_CHARS)
-        pool += chars
+        chars = _DIGITS_SAFE if exclude_ambiguous else _DIGITS
+        classes.append(chars)
         required.append(secrets.choice(chars))
 
     if symbols:
-        chars = string.punctuation
-        pool += chars
+        chars = _SYMBOLS
+        classes.append(chars)
         required.append(secrets.choice(chars))
 
-    if not pool:
+    if not classes:
         raise ValueError("At least one character class must be selected.")
+    pool = "".join(classes)
 
-    # Generate remaining characters
+    # Generate remaining characters from one batched random draw
     remaining_length = length - len(required)
-    password_chars = required + [secrets.choice(pool) for _ in range(remaining_length)]
+    password_chars = required + [pool[i] for i in _randbelow_many(len(pool), remaining_length)]
 
     # Shuffle to avoid predictable positions for required characters
-    # Fisher-Yates shuffle using secrets for randomness
-    for i in range(len(password_chars) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        password_chars[i], password_chars[j] = password_chars[j], password_chars[i]
+    _shuffle(password_chars)
 
     return "".join(password_chars)
 
@@ -135,7 +196,7 @@ def generate_passphrase(word_count: int = 4) -> str:
         Hyphen-separated passphrase string.
     """
     word_count = max(3, min(5, word_count))
-    words = [secrets.choice(WORD_LIST) for _ in range(word_count)]
+    words = [WORD_LIST[b & _WORD_MASK] for b in secrets.token_bytes(word_count)]
     return "-".join(words)
 
 
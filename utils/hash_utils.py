@@ -5,39 +5,197 @@ Uses k-anonymity model: only the first 5 characters of the SHA-1 hash
 are sent to the HIBP API. The full hash never leaves this module.
 """
 
+import asyncio
+import binascii
 import hashlib
+import time
+import warnings
+from collections import OrderedDict
+
 import httpx
 
 # HIBP API endpoint for k-anonymity range queries
 HIBP_API_URL = "https://api.pwnedpasswords.com/range/"
+HIBP_HEADERS = {"User-Agent": "PasswordGuardian-MiniProject"}
+
+# Startup warm-up must not stall boot when HIBP is unreachable
+WARM_UP_TIMEOUT = 2.0   # seconds
+
+# SHA-1 is only the HIBP lookup key here, not a security primitive.
+# CPython's hashlib prefers the OpenSSL implementation, which dispatches
+# to SHA-NI where the CPU supports it; "builtin" means the scalar _sha1
+# fallback is in use (Python built without OpenSSL).
+SHA1_BACKEND = "openssl" if hashlib.sha1.__module__ == "_hashlib" else "builtin"
+if SHA1_BACKEND == "builtin":
+    warnings.warn(
+        "hashlib is using the builtin SHA-1 fallback; build Python against "
+        "OpenSSL for hardware-accelerated hashing.",
+        RuntimeWarning
+    )
+
+# In-process cache of HIBP range responses, keyed by 5-char hash prefix.
+# Only the public range bodies are held; no password or full hash is cached.
+# A range body is ~30–35 KB, so 16 MiB holds roughly 500 hot prefixes per
+# worker process.
+PREFIX_CACHE_TTL = 3600                  # seconds
+PREFIX_CACHE_MAX_BYTES = 16 * 1024 * 1024  # least recently used evicted first
+
+_prefix_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_prefix_cache_bytes = 0
+
+# In-flight upstream fetches, one shared task per prefix
+_inflight: dict[str, asyncio.Task] = {}
 
 
-def sha1_hash(text: str) -> str:
+def sha1_hash(text: str) -> bytes:
     """
-    Compute SHA-1 hex digest of a plaintext string.
+    Compute the SHA-1 digest of a plaintext string.
     
     Args:
         text: The plaintext string to hash.
     
     Returns:
-        Uppercase hex string of the SHA-1 digest.
+        Raw 20-byte SHA-1 digest.
     """
-    return hashlib.sha1(text.encode("utf-8")).hexdigest().upper()
+    return hashlib.sha1(text.encode("utf-8"), usedforsecurity=False).digest()
+
+
+def _cache_get(prefix: str) -> bytes | None:
+    """Return a fresh cached range body for the prefix, if any."""
+    global _prefix_cache_bytes
+    entry = _prefix_cache.get(prefix)
+    if entry is None:
+        return None
+    fetched_at, body = entry
+    if time.monotonic() - fetched_at > PREFIX_CACHE_TTL:
+        del _prefix_cache[prefix]
+        _prefix_cache_bytes -= len(body)
+        return None
+    _prefix_cache.move_to_end(prefix)
+    return body
+
+
+def _cache_put(prefix: str, body: bytes) -> None:
+    """Store a range body, evicting the least recently used entries."""
+    global _prefix_cache_bytes
+    old = _prefix_cache.pop(prefix, None)
+    if old is not None:
+        _prefix_cache_bytes -= len(old[1])
+    _prefix_cache[prefix] = (time.monotonic(), body)
+    _prefix_cache_bytes += len(body)
+    while _prefix_cache_bytes > PREFIX_CACHE_MAX_BYTES and len(_prefix_cache) > 1:
+        _, (_, evicted) = _prefix_cache.popitem(last=False)
+        _prefix_cache_bytes -= len(evicted)
+
 
+async def _download_range(prefix: str, client: httpx.AsyncClient) -> bytes:
+    """Request a range body from HIBP and cache it."""
+    response = await client.get(f"{HIBP_API_URL}{prefix}", headers=HIBP_HEADERS)
+    response.raise_for_status()
+    _cache_put(prefix, response.content)
+    return response.content
 
-async def check_breach(password: str) -> dict:
+
+def _finish_fetch(prefix: str, task: asyncio.Task) -> None:
+    """Drop a completed fetch from the in-flight table."""
+    if _inflight.get(prefix) is task:
+        del _inflight[prefix]
+    if not task.cancelled():
+        task.exception()    # mark retrieved even if every waiter went away
+
+
+async def _fetch_range(prefix: str, client: httpx.AsyncClient) -> bytes:
+    """
+    Fetch the HIBP range body for a hash prefix, served from the
+    in-process cache when possible.
+    
+    Concurrent misses for the same prefix await one shared upstream
+    request and all receive its body or its exception.
+    
+    Args:
+        prefix: First 5 characters of the uppercase SHA-1 hex digest.
+        client: Shared HTTP client used for the HIBP request.
+    
+    Returns:
+        Raw response body.
+    
+    Raises:
+        httpx.HTTPError: If the upstream request fails.
+    """
+    body = _cache_get(prefix)
+    if body is not None:
+        return body
+
+    task = _inflight.get(prefix)
+    if task is None:
+        task = asyncio.ensure_future(_download_range(prefix, client))
+        _inflight[prefix] = task
+        task.add_done_callback(lambda done: _finish_fetch(prefix, done))
+    # Shield so one cancelled caller does not cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+async def warm_up(client: httpx.AsyncClient) -> None:
+    """
+    Open the connection to the HIBP API ahead of the first user-facing
+    check, so that check does not pay the TLS handshake. The fetched
+    range is cached like any other. The whole attempt, DNS included,
+    is cut off after WARM_UP_TIMEOUT seconds so a slow or unreachable
+    API cannot stall startup; failures are ignored, breach checks
+    report their own errors.
+    
+    Args:
+        client: Shared HTTP client used for HIBP requests.
+    """
+    try:
+        await asyncio.wait_for(_download_range("00000", client), WARM_UP_TIMEOUT)
+    except Exception:
+        pass
+
+
+def _find_count(body: bytes, key: bytes) -> int | None:
+    """
+    Locate a hash suffix in a raw HIBP range response.
+    
+    Response lines are "HASH_SUFFIX:COUNT"; the suffix is found with a
+    single native substring search instead of parsing every line.
+    
+    Args:
+        body: Raw response body.
+        key: Uppercase hash suffix followed by b":".
+    
+    Returns:
+        Breach count if the suffix is present, otherwise None.
+    """
+    if body.startswith(key):
+        start = len(key)
+    else:
+        start = body.find(b"\n" + key)
+        if start == -1:
+            return None
+        start += 1 + len(key)
+
+    end = body.find(b"\n", start)
+    if end == -1:
+        end = len(body)
+    return int(body[start:end])
+
+
+async def check_breach(password: str, client: httpx.AsyncClient) -> dict:
     """
     Check if a password has appeared in known data breaches using
     the HaveIBeenPwned k-anonymity API.
     
     Process:
         1. Hash the password with SHA-1.
-        2. Send only the first 5 characters (prefix) to HIBP.
+        2. Send only the first 5 characters (prefix) to HIBP, unless
+           the range for that prefix is already cached.
         3. Receive list of hash suffixes that match the prefix.
         4. Compare the remaining suffix locally.
     
     Args:
         password: The plaintext password to check.
+        client: Shared HTTP client used for the HIBP request.
     
     Returns:
         dict with keys:
@@ -46,26 +204,15 @@ async def check_breach(password: str) -> dict:
             - error (str | None): Error message if request failed.
     """
     try:
-        full_hash = sha1_hash(password)
-        prefix = full_hash[:5]
-        suffix = full_hash[5:]
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{HIBP_API_URL}{prefix}",
-                headers={"User-Agent": "PasswordGuardian-MiniProject"}
-            )
-            response.raise_for_status()
-
-        # Parse response: each line is "HASH_SUFFIX:COUNT"
-        for line in response.text.splitlines():
-            parts = line.split(":")
-            if len(parts) == 2 and parts[0].strip() == suffix:
-                return {
-                    "breached": True,
-                    "count": int(parts[1].strip()),
-                    "error": None
-                }
+        # Uppercase hex as bytes: suffix is compared against raw response bytes
+        full_hash = binascii.hexlify(sha1_hash(password)).upper()
+        prefix = full_hash[:5].decode("ascii")
+        key = full_hash[5:] + b":"
+
+        body = await _fetch_range(prefix, client)
+        count = _find_count(body, key)
+        if count is not None:
+            return {"breached": True, "count": count, "error": None}
 
         return {"breached": False, "count": 0, "error": None}
 